@@ -9,19 +9,37 @@ from .io_table_converter import (
     create_sample_io_table,
     wide_to_long_sample,
     validate_conversion,
-    process_excel_file,
+    list_excel_files,
+    process_excel_files,
+    sample_per_table,
+    select_columns,
+    INDEX_COLS,
+    TRANSACTION_COLS,
     create_index_dataframe,
     create_transaction_dataframe
 )
 
+from .table_io import write_binary_copy
+
 from pathlib import Path
+import json
 import pandas as pd
 
 
-def run_conversion():
+def run_conversion(config_path: str = 'config.json'):
     """
     Main execution function
+
+    Parameters
+    ----------
+    config_path : str
+        Path to config.json; its output.verbose flag controls whether
+        dataframe previews are printed
     """
+    verbose = False
+    if Path(config_path).exists():
+        with open(config_path, 'r', encoding='utf-8') as f:
+            verbose = json.load(f).get('output', {}).get('verbose', False)
 
     print("\n" + "="*70)
     print("한국 투입산출표 데이터 변환 스크립트")
@@ -70,15 +88,16 @@ df_long = df.reset_index().melt(
     else:
         print(f"\n{rawdata_path} 폴더의 Processing Excel files...")
 
-        excel_files = list(rawdata_path.glob('*.xlsx'))
-        print(f"Excel files found: {len(excel_files)}개")
+        # Same sorted listing as io_table_converter.main()
+        excel_names = list_excel_files(rawdata_path)
+        excel_files = [rawdata_path / name for name in excel_names[:3]]
+        print(f"Excel files found: {len(excel_names)}개")
 
         all_data = []
         all_stats = []
 
-        # Process main files (처음 3개 파일)
-        for file_path in excel_files[:3]:
-            df_long, stats = process_excel_file(str(file_path))
+        # Process main files (처음 3개 파일), one worker process per file
+        for df_long, stats in process_excel_files(excel_files):
             all_data.append(df_long)
             all_stats.append(stats)
 
@@ -94,28 +113,24 @@ df_long = df.reset_index().melt(
                 print("Sampling top 10,000 rows per sheet to reduce processing time...")
 
                 # 시트별로 샘플링 (테이블별로 샘플링)
-                sampled_data = []
                 table_col = 'table' if 'table' in df_combined_long.columns else 'source_sheet'
-                for table_name in df_combined_long[table_col].unique():
-                    sheet_data = df_combined_long[df_combined_long[table_col] == table_name]
-                    sheet_sample = sheet_data.head(10000)
-                    sampled_data.append(sheet_sample)
-
-                df_combined_long = pd.concat(sampled_data, ignore_index=True)
+                df_combined_long = sample_per_table(df_combined_long, table_col, 10000)
                 print(f"Data after sampling: {len(df_combined_long):,} 행\n")
 
             # 두 가지 길형식 데이터프레임 생성
             print("\n" + "-"*70)
             print("Creating index dataframe...")
-            df_index = create_index_dataframe(df_combined_long)
+            df_index = create_index_dataframe(select_columns(df_combined_long, INDEX_COLS))
             print(f"✓ Complete: {len(df_index):,} sectors/products")
-            print(df_index.head(10))
+            if verbose:
+                print(df_index.head(10))
 
             print("\n" + "-"*70)
             print("Creating transaction dataframe...")
-            df_transaction = create_transaction_dataframe(df_combined_long)
+            df_transaction = create_transaction_dataframe(select_columns(df_combined_long, TRANSACTION_COLS))
             print(f"✓ Complete: {len(df_transaction):,} transaction records")
-            print(df_transaction.head(10))
+            if verbose:
+                print(df_transaction.head(10))
 
             # CSV로 저장
             print("\n" + "-"*70)
@@ -134,6 +149,13 @@ df_long = df.reset_index().melt(
             print(f"✓ {index_path}")
             print(f"✓ {transaction_path}")
 
+            # Arrow IPC copies (as written by io_table_converter.main) load
+            # without text parsing; the analysis picks them up automatically
+            for df_out, csv_path in ((df_index, index_path), (df_transaction, transaction_path)):
+                arrow_path = write_binary_copy(df_out, csv_path, suffix='.arrow')
+                if arrow_path:
+                    print(f"✓ {arrow_path}")
+
     # ========== 최종 요약 ==========
     print("\n\n" + "="*70)
     print("처리 Complete")
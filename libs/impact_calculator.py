@@ -4,6 +4,9 @@ Calculates economic impact of sector input based on analysis results
 """
 
 import pandas as pd
+import numpy as np
+
+from .table_io import read_table, resolve_table_path
 
 
 def calculate_economic_impact(input_amount_kwon=1000000, direction="forward"):
@@ -34,14 +37,17 @@ def calculate_economic_impact(input_amount_kwon=1000000, direction="forward"):
         sector_col = 'output_sector_name'
         region_col = 'output_region'
 
-    df_impact = pd.read_csv(csv_file, encoding='utf-8-sig')
+    # Prefer the Parquet copy written by save_results when it is current
+    df_impact = read_table(resolve_table_path(csv_file))
 
     # The 'value' column contains production coefficient
     # impact = production_coefficient × input_amount
-    df_impact['economic_impact_kwon'] = df_impact['value'] * input_amount_kwon
+    impacts = df_impact['value'].to_numpy() * input_amount_kwon
+    df_impact['economic_impact_kwon'] = impacts
 
     # Sort by impact (descending)
-    df_impact = df_impact.sort_values('economic_impact_kwon', ascending=False)
+    order = np.argsort(-impacts, kind='stable')
+    df_impact = df_impact.iloc[order].reset_index(drop=True)
 
     # Display results
     print("\n" + "="*80)
@@ -50,25 +56,37 @@ def calculate_economic_impact(input_amount_kwon=1000000, direction="forward"):
     print("="*80)
     print()
 
+    # Pull display columns out once instead of boxing every row into a Series
     if direction == "forward":
+        prefix = 'input'
         print("Sectors that provide INPUTS to Steel production:")
-        for idx, row in df_impact.iterrows():
-            region_info = f" ({row['input_region']})" if pd.notna(row.get('input_region')) else ""
-            print(f"  • {row['input_sector_name']}{region_info} (Code: {row['input_sector_code']})")
-            print(f"    Input Coefficient: {row['value']:.6f}")
-            print(f"    Total Input Needed: {row['economic_impact_kwon']:,.0f} KRW")
     else:
+        prefix = 'output'
         print("Sectors that CONSUME Steel input:")
-        for idx, row in df_impact.iterrows():
-            region_info = f" ({row['output_region']})" if pd.notna(row.get('output_region')) else ""
-            print(f"  • {row['output_sector_name']}{region_info} (Code: {row['output_sector_code']})")
-            print(f"    Consumption Coefficient: {row['value']:.6f}")
-            print(f"    Total Consumption: {row['economic_impact_kwon']:,.0f} KRW")
+
+    names = df_impact[f'{prefix}_sector_name'].to_numpy()
+    codes = df_impact[f'{prefix}_sector_code'].to_numpy()
+    values = df_impact['value'].to_numpy()
+    impacts = df_impact['economic_impact_kwon'].to_numpy()
+    if region_col in df_impact.columns:
+        regions = df_impact[region_col].to_numpy()
+    else:
+        regions = np.full(len(df_impact), None)
+
+    for name, code, value, impact, region in zip(names, codes, values, impacts, regions):
+        region_info = f" ({region})" if pd.notna(region) else ""
+        print(f"  • {name}{region_info} (Code: {code})")
+        if direction == "forward":
+            print(f"    Input Coefficient: {value:.6f}")
+            print(f"    Total Input Needed: {impact:,.0f} KRW")
+        else:
+            print(f"    Consumption Coefficient: {value:.6f}")
+            print(f"    Total Consumption: {impact:,.0f} KRW")
 
     print()
 
     # Summary
-    total_impact = df_impact['economic_impact_kwon'].sum()
+    total_impact = np.nansum(impacts)
     print("="*80)
     print(f"Total Economic Impact: {total_impact:,.0f} KRW")
     print(f"Affected Sectors: {len(df_impact)}")
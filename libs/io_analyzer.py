@@ -9,6 +9,20 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import json
 
+from .table_io import CSV_NA_VALUES, read_table, resolve_table_path, write_binary_copy
+
+# Copy-on-Write makes filtered frames lazy views; it is always on from pandas 3.
+# This is process-wide; the converter never writes through views, so it runs
+# unchanged when main.py loads both
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.options.mode.copy_on_write = True
+
+CATEGORICAL_COLUMNS = (
+    'geographical_level', 'table',
+    'output_region', 'output_sector_name',
+    'input_region', 'input_sector_name',
+)
+
 
 def load_config(config_path: str = 'config.json') -> Dict:
     """
@@ -44,20 +58,44 @@ def load_data(config: Dict) -> Tuple[pd.DataFrame, pd.DataFrame]:
         (transaction_df, index_df)
     """
     data_config = config['data_source']
+
+    # An up-to-date binary copy of a CSV holds the same table and loads
+    # without text parsing
+    df_trans = read_table(resolve_table_path(data_config['transaction_data_path']))
+
+    # Low-cardinality labels compare and group much faster as categoricals
+    for col in CATEGORICAL_COLUMNS:
+        if col in df_trans.columns:
+            df_trans[col] = df_trans[col].astype('category')
+
+    # Store values as float32 when that loses no precision
+    if df_trans['value'].dtype == np.float64:
+        values_32 = df_trans['value'].astype(np.float32)
+        if np.array_equal(values_32.to_numpy(np.float64), df_trans['value'].to_numpy(), equal_nan=True):
+            df_trans['value'] = values_32
     
-    df_trans = pd.read_csv(
-        data_config['transaction_data_path'],
-        encoding='utf-8-sig'
-    )
-    
-    df_index = pd.read_csv(
-        data_config['index_data_path'],
-        encoding='utf-8-sig'
-    )
+    df_index = read_table(resolve_table_path(data_config['index_data_path']))
     
     return df_trans, df_index
 
 
+def _sector_code_mask(df: pd.DataFrame, col: str, sectors: List) -> np.ndarray:
+    """
+    Boolean mask of rows whose sector code (as string) is in sectors
+
+    Only the distinct codes are converted to strings and matched; rows
+    are then selected by their integer category codes.
+    """
+    values = df[col]
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes, categories = values.cat.codes.to_numpy(), values.cat.categories
+    else:
+        codes, categories = pd.factorize(values, sort=False)
+    wanted = pd.array([str(s) for s in sectors], dtype='string')
+    wanted_codes = np.flatnonzero(pd.Index(categories).astype('string').isin(wanted))
+    return np.isin(codes, wanted_codes)
+
+
 def apply_filters(df: pd.DataFrame, config: Dict) -> pd.DataFrame:
     """
     Apply all filters from config to dataframe
@@ -74,64 +112,140 @@ def apply_filters(df: pd.DataFrame, config: Dict) -> pd.DataFrame:
     pd.DataFrame
         Filtered dataframe
     """
-    df_filtered = df.copy()
     filters = config.get('filters', {})
-    
+
+    # Combine every predicate into one boolean mask and index the frame once
+    mask = np.ones(len(df), dtype=bool)
+
     # Filter by geographical level
     if filters.get('geographical_level'):
-        df_filtered = df_filtered[
-            df_filtered['geographical_level'] == filters['geographical_level']
-        ]
-    
+        mask &= (df['geographical_level'] == filters['geographical_level']).to_numpy()
+
     # Filter by tables (only if column exists)
-    if filters.get('tables') and 'table' in df_filtered.columns:
-        df_filtered = df_filtered[
-            df_filtered['table'].isin(filters['tables'])
-        ]
-    
+    if filters.get('tables') and 'table' in df.columns:
+        mask &= df['table'].isin(filters['tables']).to_numpy()
+
     # Filter by output region (only if column exists)
-    if filters.get('output_region') and 'output_region' in df_filtered.columns:
-        df_filtered = df_filtered[
-            df_filtered['output_region'] == filters['output_region']
-        ]
+    if filters.get('output_region') and 'output_region' in df.columns:
+        mask &= (df['output_region'] == filters['output_region']).to_numpy()
 
     # Filter by input region (only if column exists)
-    if filters.get('input_region') and 'input_region' in df_filtered.columns:
-        df_filtered = df_filtered[
-            df_filtered['input_region'] == filters['input_region']
-        ]
-    
+    if filters.get('input_region') and 'input_region' in df.columns:
+        mask &= (df['input_region'] == filters['input_region']).to_numpy()
+
     # Filter by output sectors
     if filters.get('output_sectors'):
-        df_filtered = df_filtered[
-            df_filtered['output_sector_code'].astype(str).isin(
-                [str(s) for s in filters['output_sectors']]
-            )
-        ]
-    
+        mask &= _sector_code_mask(df, 'output_sector_code', filters['output_sectors'])
+
     # Filter by input sectors
     if filters.get('input_sectors'):
-        df_filtered = df_filtered[
-            df_filtered['input_sector_code'].astype(str).isin(
-                [str(s) for s in filters['input_sectors']]
-            )
-        ]
-    
-    # Filter by value range
+        mask &= _sector_code_mask(df, 'input_sector_code', filters['input_sectors'])
+
+    # Filter by value range; compare in float64 so a float32 value column
+    # doesn't round the thresholds
     if filters.get('min_value') is not None:
-        df_filtered = df_filtered[
-            df_filtered['value'] >= filters['min_value']
-        ]
-    
+        mask &= df['value'].to_numpy(np.float64) >= filters['min_value']
+
     if filters.get('max_value') is not None:
-        df_filtered = df_filtered[
-            df_filtered['value'] <= filters['max_value']
-        ]
-    
-    return df_filtered
+        mask &= df['value'].to_numpy(np.float64) <= filters['max_value']
+
+    return df.loc[mask]
+
+
+def get_schema(df: pd.DataFrame) -> Dict:
+    """
+    Record which optional region columns hold data
 
+    Computed once per filtered frame so forward and backward analyses
+    don't each rescan the region columns.
 
-def analyze_forward(df: pd.DataFrame, aggregation: str = 'sum') -> pd.DataFrame:
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Transaction dataframe
+
+    Returns
+    -------
+    dict
+        Flags 'has_output_region' and 'has_input_region'
+    """
+    return {
+        f'has_{side}_region': bool(
+            f'{side}_region' in df.columns and df[f'{side}_region'].notna().any()
+        )
+        for side in ('output', 'input')
+    }
+
+
+def _sort_result(result: pd.DataFrame, sort_cols: List[str]) -> pd.DataFrame:
+    """
+    Order result by sort_cols (ascending), then value (descending), then
+    the remaining key columns (ascending)
+
+    The remaining key columns break ties as the sorted groupby order did,
+    so the order doesn't depend on the input row order. Each key column
+    is ranked with a sorted factorize (category codes for categoricals)
+    and the ranks are ordered with a single np.lexsort.
+    """
+    tie_cols = [col for col in result.columns if col != 'value' and col not in sort_cols]
+    keys = [pd.factorize(result[col], sort=True)[0] for col in reversed(tie_cols)]
+    keys.append(-result['value'].to_numpy())
+    for col in reversed(sort_cols):
+        keys.append(pd.factorize(result[col], sort=True)[0])
+    return result.iloc[np.lexsort(keys)]
+
+
+def _group_aggregate(df: pd.DataFrame, groupby_cols: List[str], aggregation: str) -> pd.DataFrame:
+    """
+    Aggregate 'value' by groupby_cols (rows with a missing key are dropped)
+    """
+    values = df['value']
+    if values.dtype == np.float32:
+        values = values.astype(np.float64)
+    result = (
+        values.groupby([df[col] for col in groupby_cols], sort=False, observed=True)
+        .agg(aggregation)
+        .reset_index()
+    )
+    result.columns = groupby_cols + ['value']
+    return result
+
+
+def _directional_groupby_cols(first: str, second: str, schema: Dict) -> List[str]:
+    """
+    Grouping keys: [first region], first sector, [second region], second sector
+    """
+    groupby_cols = [f'{first}_sector_code', f'{first}_sector_name']
+
+    # Check if regional data exists
+    if schema[f'has_{first}_region']:
+        groupby_cols.insert(0, f'{first}_region')
+
+    groupby_cols.extend([f'{second}_sector_code', f'{second}_sector_name'])
+
+    if schema[f'has_{second}_region']:
+        groupby_cols.insert(len(groupby_cols)-2, f'{second}_region')
+
+    return groupby_cols
+
+
+def _forward_groupby_cols(schema: Dict) -> List[str]:
+    return _directional_groupby_cols('output', 'input', schema)
+
+
+def _backward_groupby_cols(schema: Dict) -> List[str]:
+    return _directional_groupby_cols('input', 'output', schema)
+
+
+def _sector_sort_cols(groupby_cols: List[str]) -> List[str]:
+    """
+    Leading sector code and name columns used to order results
+    """
+    return [col for col in groupby_cols if 'region' not in col][:2]
+
+
+def analyze_forward(df: pd.DataFrame, aggregation: str = 'sum',
+                    schema: Optional[Dict] = None) -> pd.DataFrame:
     """
     Forward analysis: Output Sector → Input Sector
     Calculate total input requirements for each output sector
@@ -142,6 +256,8 @@ def analyze_forward(df: pd.DataFrame, aggregation: str = 'sum') -> pd.DataFrame:
         Filtered transaction dataframe
     aggregation : str
         Aggregation function: 'sum', 'mean', 'median', 'max', 'min'
+    schema : dict, optional
+        Column flags from get_schema(df); computed if not given
         
     Returns
     -------
@@ -150,31 +266,24 @@ def analyze_forward(df: pd.DataFrame, aggregation: str = 'sum') -> pd.DataFrame:
     """
     if len(df) == 0:
         return pd.DataFrame()
+
+    if schema is None:
+        schema = get_schema(df)
     
     # Group by output and input sectors
-    groupby_cols = ['output_sector_code', 'output_sector_name']
-    
-    # Check if regional data exists
-    if 'output_region' in df.columns and df['output_region'].notna().any():
-        groupby_cols.insert(0, 'output_region')
-    
-    groupby_cols.extend(['input_sector_code', 'input_sector_name'])
-    
-    if 'input_region' in df.columns and df['input_region'].notna().any():
-        groupby_cols.insert(len(groupby_cols)-2, 'input_region')
+    groupby_cols = _forward_groupby_cols(schema)
     
     # Apply aggregation
-    result = df.groupby(groupby_cols)['value'].agg(aggregation).reset_index()
-    result.columns = groupby_cols + ['value']
+    result = _group_aggregate(df, groupby_cols, aggregation)
     
     # Sort by output sector and value (descending)
-    sort_cols = [col for col in groupby_cols if 'region' not in col][:2]
-    result = result.sort_values(sort_cols + ['value'], ascending=[True, True, False])
+    result = _sort_result(result, _sector_sort_cols(groupby_cols))
     
     return result
 
 
-def analyze_backward(df: pd.DataFrame, aggregation: str = 'sum') -> pd.DataFrame:
+def analyze_backward(df: pd.DataFrame, aggregation: str = 'sum',
+                     schema: Optional[Dict] = None) -> pd.DataFrame:
     """
     Backward analysis: Input Sector → Output Sector
     Calculate total output for each input sector
@@ -185,6 +294,8 @@ def analyze_backward(df: pd.DataFrame, aggregation: str = 'sum') -> pd.DataFrame
         Filtered transaction dataframe
     aggregation : str
         Aggregation function: 'sum', 'mean', 'median', 'max', 'min'
+    schema : dict, optional
+        Column flags from get_schema(df); computed if not given
         
     Returns
     -------
@@ -193,30 +304,164 @@ def analyze_backward(df: pd.DataFrame, aggregation: str = 'sum') -> pd.DataFrame
     """
     if len(df) == 0:
         return pd.DataFrame()
+
+    if schema is None:
+        schema = get_schema(df)
     
     # Group by input and output sectors (reversed from forward)
-    groupby_cols = ['input_sector_code', 'input_sector_name']
-    
-    # Check if regional data exists
-    if 'input_region' in df.columns and df['input_region'].notna().any():
-        groupby_cols.insert(0, 'input_region')
-    
-    groupby_cols.extend(['output_sector_code', 'output_sector_name'])
-    
-    if 'output_region' in df.columns and df['output_region'].notna().any():
-        groupby_cols.insert(len(groupby_cols)-2, 'output_region')
+    groupby_cols = _backward_groupby_cols(schema)
     
     # Apply aggregation
-    result = df.groupby(groupby_cols)['value'].agg(aggregation).reset_index()
-    result.columns = groupby_cols + ['value']
+    result = _group_aggregate(df, groupby_cols, aggregation)
     
     # Sort by input sector and value (descending)
-    sort_cols = [col for col in groupby_cols if 'region' not in col][:2]
-    result = result.sort_values(sort_cols + ['value'], ascending=[True, True, False])
+    result = _sort_result(result, _sector_sort_cols(groupby_cols))
     
     return result
 
 
+def _aggregate_both(df: pd.DataFrame, aggregation: str,
+                    schema: Dict) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Forward and backward analysis results from a single aggregation
+
+    Both directions group by the same set of columns, only in a different
+    order, so the data is aggregated once and each result is a reordered
+    projection of the shared groups.
+    """
+    if len(df) == 0:
+        return pd.DataFrame(), pd.DataFrame()
+
+    forward_cols = _forward_groupby_cols(schema)
+    backward_cols = _backward_groupby_cols(schema)
+
+    grouped = _group_aggregate(df, forward_cols, aggregation)
+    forward = _sort_result(grouped, _sector_sort_cols(forward_cols))
+    backward = _sort_result(grouped[backward_cols + ['value']], _sector_sort_cols(backward_cols))
+    return forward, backward
+
+
+def _analyze_polars(config: Dict, aggregation: str,
+                    direction: str) -> Tuple[Optional[pd.DataFrame], Optional[pd.DataFrame]]:
+    """
+    Filter and aggregate the transaction table as one lazy Polars plan
+
+    The filters are pushed down into the file scan and the grouping runs
+    on all cores. Results match analyze_forward/analyze_backward and are
+    returned as pandas DataFrames.
+    """
+    try:
+        import polars as pl
+    except ImportError as e:
+        raise ImportError("analysis engine 'polars' requires the polars package") from e
+
+    aggregations = {
+        'sum': pl.col('value').sum(),
+        'mean': pl.col('value').mean(),
+        'median': pl.col('value').median(),
+        'max': pl.col('value').max(),
+        'min': pl.col('value').min(),
+    }
+    if aggregation not in aggregations:
+        raise ValueError(f"Unsupported aggregation for polars engine: {aggregation}")
+
+    path = resolve_table_path(config['data_source']['transaction_data_path'])
+    suffix = path.suffix
+    if suffix == '.parquet':
+        lf = pl.scan_parquet(path)
+    elif suffix in ('.arrow', '.feather'):
+        lf = pl.scan_ipc(path)
+    else:
+        # Infer types from the whole file, as pandas does; sector codes can
+        # turn non-numeric ('A01') far past the default 100-row sample.
+        # NA tokens such as 'nan' are nulls, not group keys, as in read_csv
+        lf = pl.scan_csv(path, infer_schema_length=None, null_values=CSV_NA_VALUES)
+    file_schema = lf.collect_schema()
+    columns = file_schema.names()
+    lf_file = lf
+
+    # Same predicates as apply_filters
+    filters = config.get('filters', {})
+    preds = []
+    if filters.get('geographical_level'):
+        preds.append(pl.col('geographical_level') == filters['geographical_level'])
+    if filters.get('tables') and 'table' in columns:
+        preds.append(pl.col('table').is_in(filters['tables']))
+    for side in ('output', 'input'):
+        if filters.get(f'{side}_region') and f'{side}_region' in columns:
+            preds.append(pl.col(f'{side}_region') == filters[f'{side}_region'])
+        if filters.get(f'{side}_sectors'):
+            sectors = [str(s) for s in filters[f'{side}_sectors']]
+            code = pl.col(f'{side}_sector_code')
+            code_str = code.cast(pl.Utf8)
+            if file_schema[f'{side}_sector_code'].is_integer():
+                # pandas holds integer codes with missing values as floats
+                # and matches them as '1.0'; the predicates see the whole file
+                code_str = pl.when(code.is_null().any()).then(code.cast(pl.Float64).cast(pl.Utf8)).otherwise(code_str)
+            preds.append(code_str.is_in(sectors))
+    if filters.get('min_value') is not None:
+        preds.append(pl.col('value') >= filters['min_value'])
+    if filters.get('max_value') is not None:
+        preds.append(pl.col('value') <= filters['max_value'])
+    if preds:
+        lf = lf.filter(pl.all_horizontal(preds))
+
+    # Group once by every key either direction can use, keeping missing
+    # keys. The region flags (as in get_schema) then come from the grouped
+    # rows, so the file is scanned a single time. A region without data is
+    # all-null and forms a single key value, so dropping it from the keys
+    # afterwards needs no re-aggregation
+    candidate_cols = _forward_groupby_cols({
+        f'has_{side}_region': f'{side}_region' in columns for side in ('output', 'input')
+    })
+    grouped_plan = (
+        lf.group_by(candidate_cols, maintain_order=True)
+        .agg(aggregations[aggregation].alias('value'))
+    )
+
+    # pandas reads an integer column with missing values (anywhere in the
+    # file) as float64; the null counts share the grouping's file scan
+    int_keys = [col for col in candidate_cols if file_schema[col].is_integer()]
+    if int_keys:
+        grouped, null_counts = pl.collect_all([grouped_plan, lf_file.select(pl.col(int_keys).null_count())])
+        float_keys = [col for col in int_keys if null_counts[col][0] > 0]
+        grouped = grouped.with_columns(pl.col(float_keys).cast(pl.Float64))
+    else:
+        grouped = grouped_plan.collect()
+    schema = {
+        f'has_{side}_region': bool(f'{side}_region' in columns
+                                   and grouped[f'{side}_region'].is_not_null().any())
+        for side in ('output', 'input')
+    }
+
+    forward_cols = _forward_groupby_cols(schema)
+    backward_cols = _backward_groupby_cols(schema)
+
+    # Both directions group by the same columns; drop_nulls matches
+    # pandas groupby dropping missing keys
+    grouped = grouped.drop_nulls(forward_cols)
+    if grouped.height == 0:
+        empty = pd.DataFrame()
+        return (empty if direction in ['forward', 'both'] else None,
+                empty if direction in ['backward', 'both'] else None)
+
+    def _sorted(groupby_cols: List[str]) -> pd.DataFrame:
+        # Same order as _sort_result: sector, value (descending), other keys
+        sort_cols = _sector_sort_cols(groupby_cols)
+        tie_cols = [col for col in groupby_cols if col not in sort_cols]
+        return (
+            grouped.select(groupby_cols + ['value'])
+            .sort(sort_cols + ['value'] + tie_cols,
+                  descending=[False, False, True] + [False] * len(tie_cols),
+                  nulls_last=True, maintain_order=True)
+            .to_pandas()
+        )
+
+    forward = _sorted(forward_cols) if direction in ['forward', 'both'] else None
+    backward = _sorted(backward_cols) if direction in ['backward', 'both'] else None
+    return forward, backward
+
+
 def get_sector_summary(df: pd.DataFrame) -> Dict:
     """
     Get summary statistics for analysis
@@ -234,18 +479,30 @@ def get_sector_summary(df: pd.DataFrame) -> Dict:
     if len(df) == 0:
         return {'total_records': 0, 'total_value': 0}
     
+    # Reduce one float array directly, skipping NaN like the pandas reductions
+    vals = df['value'].to_numpy(dtype=np.float64, na_value=np.nan)
+    vals = vals[~np.isnan(vals)]
+    if vals.size == 0:
+        return {
+            'total_records': len(df),
+            'total_value': np.float64(0.0),
+            'mean_value': np.nan,
+            'max_value': np.nan,
+            'min_value': np.nan,
+        }
+    
     return {
         'total_records': len(df),
-        'total_value': df['value'].sum(),
-        'mean_value': df['value'].mean(),
-        'max_value': df['value'].max(),
-        'min_value': df['value'].min(),
+        'total_value': vals.sum(),
+        'mean_value': vals.mean(),
+        'max_value': vals.max(),
+        'min_value': vals.min(),
     }
 
 
 def save_results(results: Dict, output_dir: str = 'analysis_results') -> None:
     """
-    Save analysis results to CSV files
+    Save analysis results to CSV files (plus Parquet copies when possible)
     
     Parameters
     ----------
@@ -261,11 +518,15 @@ def save_results(results: Dict, output_dir: str = 'analysis_results') -> None:
         forward_path = output_path / 'forward_analysis.csv'
         results['forward'].to_csv(forward_path, index=False, encoding='utf-8-sig')
         print(f"✓ Saved forward analysis to {forward_path}")
+        if write_binary_copy(results['forward'], forward_path):
+            print(f"✓ Saved forward analysis to {forward_path.with_suffix('.parquet')}")
     
     if 'backward' in results and len(results['backward']) > 0:
         backward_path = output_path / 'backward_analysis.csv'
         results['backward'].to_csv(backward_path, index=False, encoding='utf-8-sig')
         print(f"✓ Saved backward analysis to {backward_path}")
+        if write_binary_copy(results['backward'], backward_path):
+            print(f"✓ Saved backward analysis to {backward_path.with_suffix('.parquet')}")
 
 
 def run_analysis(config_path: str = 'config.json') -> Dict:
@@ -284,28 +545,49 @@ def run_analysis(config_path: str = 'config.json') -> Dict:
     """
     # Load configuration
     config = load_config(config_path)
-    
-    # Load data
-    df_trans, df_index = load_data(config)
-    
-    if config.get('output', {}).get('verbose'):
-        print("Data loaded successfully")
-        print(f"  Transaction records: {len(df_trans)}")
-        print(f"  Index sectors: {len(df_index)}")
-    
-    # Apply filters
-    df_filtered = apply_filters(df_trans, config)
-    
-    if config.get('output', {}).get('verbose'):
-        print(f"After filtering: {len(df_filtered)} records")
-    
-    # Run analysis based on direction
-    results = {}
     aggregation = config['analysis'].get('aggregation', 'sum')
     direction = config['analysis'].get('direction', 'both')
+
+    if config['analysis'].get('engine', 'pandas') == 'polars':
+        # Filter and aggregate straight from the file in one lazy plan
+        forward, backward = _analyze_polars(config, aggregation, direction)
+    else:
+        # Load data
+        df_trans, df_index = load_data(config)
+        
+        if config.get('output', {}).get('verbose'):
+            print("Data loaded successfully")
+            print(f"  Transaction records: {len(df_trans)}")
+            print(f"  Index sectors: {len(df_index)}")
+        
+        # Apply filters
+        df_filtered = apply_filters(df_trans, config)
+        
+        if config.get('output', {}).get('verbose'):
+            print(f"After filtering: {len(df_filtered)} records")
+        
+        # Run analysis based on direction
+        schema = get_schema(df_filtered)
+
+        if direction == 'both':
+            # Both directions share a single groupby
+            forward, backward = _aggregate_both(df_filtered, aggregation, schema)
+        elif direction == 'forward':
+            forward, backward = analyze_forward(df_filtered, aggregation, schema), None
+        elif direction == 'backward':
+            forward, backward = None, analyze_backward(df_filtered, aggregation, schema)
+        else:
+            forward, backward = None, None
+
+        # Drop the filtered rows and the columns load_data derived before the
+        # results are summarized and saved; the parsed file itself stays in
+        # read_table's cache so a later run in this process skips parsing
+        del df_trans, df_filtered
     
+    results = {}
+
     if direction in ['forward', 'both']:
-        results['forward'] = analyze_forward(df_filtered, aggregation)
+        results['forward'] = forward
         results['forward_summary'] = get_sector_summary(results['forward'])
         
         if config.get('output', {}).get('verbose'):
@@ -314,7 +596,7 @@ def run_analysis(config_path: str = 'config.json') -> Dict:
             print(f"  Total value: {results['forward_summary']['total_value']:,.2f}")
     
     if direction in ['backward', 'both']:
-        results['backward'] = analyze_backward(df_filtered, aggregation)
+        results['backward'] = backward
         results['backward_summary'] = get_sector_summary(results['backward'])
         
         if config.get('output', {}).get('verbose'):
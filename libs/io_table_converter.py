@@ -8,11 +8,40 @@ Korean Input-Output (IO) Table Data Conversion Script
 
 import pandas as pd
 import numpy as np
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Tuple, List, Dict
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from .table_io import write_binary_copy
+except ImportError:
+    # Run as a script (python libs/io_table_converter.py)
+    from table_io import write_binary_copy
+
+try:
+    import python_calamine  # noqa: F401
+    # Rust-backed XLSX parser, much faster than openpyxl for large workbooks;
+    # pandas accepts engine='calamine' from 2.2 on
+    _PANDAS_VERSION = tuple(int(part) for part in pd.__version__.split('.')[:2])
+    EXCEL_ENGINE = 'calamine' if _PANDAS_VERSION >= (2, 2) else None
+except ImportError:
+    EXCEL_ENGINE = None  # pandas default (openpyxl)
+
+# Summary row/column keywords, compiled once into single alternations
+SUMMARY_ROW_RE = re.compile('|'.join(map(re.escape, ['계', '소계', '중간합계', '합계', '유발'])))
+SUMMARY_COL_RE = re.compile('|'.join(map(re.escape, ['계', '합계', '총', '중간'])))
+
+# Long-format columns read by create_index_dataframe / create_transaction_dataframe
+INDEX_COLS = ('output_region', 'output_sector_code', 'output_sector_name',
+              'input_sector_code', 'geographical_level')
+TRANSACTION_COLS = ('geographical_level', 'table',
+                    'output_region', 'output_sector_code', 'output_sector_name',
+                    'input_region', 'input_sector_code', 'input_sector_name', 'value')
+
 
 # ============================================================================
 # 1. Sample Data Generation Functions
@@ -71,6 +100,24 @@ def wide_to_long_sample(df_wide: pd.DataFrame) -> pd.DataFrame:
     return df_long
 
 
+def _nan_sum(values: np.ndarray, axis=None):
+    """Sum an array, skipping NaN for float data"""
+    if values.dtype.kind == 'f':
+        return np.nansum(values, axis=axis)
+    return values.sum(axis=axis)
+
+
+def _long_group_sums(df_long: pd.DataFrame, key: str, values: np.ndarray) -> pd.Series:
+    """Sum values per sorted key with one scatter-add (groupby sum equivalent)"""
+    codes, uniques = pd.factorize(df_long[key], sort=True)
+    if values.dtype.kind == 'f':
+        values = np.nan_to_num(values, nan=0.0)
+    sums = np.zeros(len(uniques), dtype=values.dtype)
+    valid = codes >= 0
+    np.add.at(sums, codes[valid], values[valid])
+    return pd.Series(sums, index=pd.Index(uniques, name=key), name='transaction_amount')
+
+
 def validate_conversion(df_wide: pd.DataFrame, df_long: pd.DataFrame) -> None:
     """
     Validate wide/long format conversion
@@ -81,12 +128,18 @@ def validate_conversion(df_wide: pd.DataFrame, df_long: pd.DataFrame) -> None:
     print("Validation: Wide ↔ Long Format Conversion Consistency")
     print("="*70)
 
+    # Reduce each side from a single array (NaN-aware like pandas sums)
+    wide_values = df_wide.to_numpy()
+    long_values = df_long['transaction_amount'].to_numpy()
+    wide_rows = _nan_sum(wide_values, axis=1)
+    wide_cols = _nan_sum(wide_values, axis=0)
+
     # Row sum validation (total transaction per output sector)
     print("\n[1] Total Transaction Amount by Output Sector (Row Sum)")
     print("-" * 70)
 
-    wide_row_sums = df_wide.sum(axis=1)
-    long_output_sums = df_long.groupby('output_sector')['transaction_amount'].sum()
+    wide_row_sums = pd.Series(wide_rows, index=df_wide.index)
+    long_output_sums = _long_group_sums(df_long, 'output_sector', long_values)
 
     print("Wide format row sum:")
     print(wide_row_sums)
@@ -101,8 +154,8 @@ def validate_conversion(df_wide: pd.DataFrame, df_long: pd.DataFrame) -> None:
     print("\n[2] Total Transaction Amount by Input Sector (Column Sum)")
     print("-" * 70)
 
-    wide_col_sums = df_wide.sum(axis=0)
-    long_input_sums = df_long.groupby('input_sector')['transaction_amount'].sum()
+    wide_col_sums = pd.Series(wide_cols, index=df_wide.columns)
+    long_input_sums = _long_group_sums(df_long, 'input_sector', long_values)
 
     print("Wide format column sum:")
     print(wide_col_sums)
@@ -114,8 +167,8 @@ def validate_conversion(df_wide: pd.DataFrame, df_long: pd.DataFrame) -> None:
     print(f"\nColumn sum match: {col_match} ✓" if col_match else f"\nColumn sum match: {col_match} ✗")
 
     # Total transaction validation
-    wide_total = df_wide.sum().sum()
-    long_total = df_long['transaction_amount'].sum()
+    wide_total = wide_rows.sum()
+    long_total = _nan_sum(long_values)
     total_match = np.isclose(wide_total, long_total)
 
     print("\n[3] Total Transaction Amount")
@@ -134,22 +187,19 @@ def identify_summary_rows(df: pd.DataFrame, sector_col: int = 1) -> List[int]:
     Identify summary rows (부가가치, 총계 등)
     Identify using Korean keywords: 계, 소계, 중간합계
     """
-    summary_keywords = ['계', '소계', '중간합계', '합계', '유발']
-    summary_row_indices = []
+    return df.index[_summary_row_mask(df, sector_col)].tolist()
 
-    if sector_col >= len(df.columns):
-        return summary_row_indices
 
-    for idx in df.index:
-        try:
-            cell_value = str(df.iloc[idx, sector_col]).strip()
-            # Check if contains any keyword
-            if any(keyword in cell_value for keyword in summary_keywords):
-                summary_row_indices.append(idx)
-        except:
-            continue
+def _summary_row_mask(df: pd.DataFrame, sector_col: int) -> np.ndarray:
+    """
+    Boolean mask of summary rows (see identify_summary_rows)
+    """
+    if sector_col >= len(df.columns):
+        return np.zeros(len(df), dtype=bool)
 
-    return summary_row_indices
+    # One regex scan over the whole column (empty cells never match)
+    cells = df.iloc[:, sector_col].astype(str).str.strip()
+    return cells.str.contains(SUMMARY_ROW_RE, na=False).to_numpy(dtype=bool)
 
 
 def identify_summary_columns(df: pd.DataFrame, header_row: int = 4) -> List[int]:
@@ -158,26 +208,15 @@ def identify_summary_columns(df: pd.DataFrame, header_row: int = 4) -> List[int]
     - Exclude first 2 columns (Sector code, 이름)
     - Last few columns likely contain totals
     """
-    # Find summary keywords in header rows
-    summary_keywords = ['계', '합계', '총', '중간']
-    summary_col_indices = []
+    if header_row >= len(df):
+        return []
 
-    if header_row < len(df):
-        try:
-            for col_idx in df.columns:
-                try:
-                    if isinstance(col_idx, int) and col_idx < 2:  # Exclude first 2 columns
-                        continue
+    # One regex scan over the header row, skipping the first 2 columns
+    # (Sector code, 이름) by position
+    headers = df.iloc[header_row, 2:].astype(str).str.strip()
+    mask = headers.str.contains(SUMMARY_COL_RE, na=False).to_numpy(dtype=bool)
 
-                    header_value = str(df.iloc[header_row, col_idx]).strip()
-                    if any(keyword in header_value for keyword in summary_keywords):
-                        summary_col_indices.append(col_idx)
-                except:
-                    continue
-        except:
-            pass
-
-    return summary_col_indices
+    return headers.index[mask].tolist()
 
 
 def clean_io_table(df: pd.DataFrame,
@@ -192,9 +231,9 @@ def clean_io_table(df: pd.DataFrame,
     3. Remove summary columns
     4. Keep sector code and name (For regional tables, also keep region)
     """
-    # Remove header rows
-    df_clean = df.iloc[header_rows:].copy()
-    df_clean.reset_index(drop=True, inplace=True)
+    # Header rows are skipped by position; rows and columns to keep are
+    # collected as masks and the frame is materialized once at the end
+    body = df.iloc[header_rows:]
 
     # Regional table: Keep region, sector code, and sector name
     # National table: Keep only sector code and sector name
@@ -206,39 +245,112 @@ def clean_io_table(df: pd.DataFrame,
         # Column 0: Sector code, Column 1: Sector name
         data_start_col = 2
 
-    # Identify and remove summary rows (For regional tables, search in different column)
+    # Identify summary rows (For regional tables, search in different column)
     if is_regional:
-        summary_row_indices = identify_summary_rows(df_clean, sector_col=1)
+        non_summary = ~_summary_row_mask(body, sector_col=1)
     else:
-        summary_row_indices = identify_summary_rows(df_clean, sector_col=0)
-
-    df_clean = df_clean.drop(summary_row_indices).reset_index(drop=True)
+        non_summary = ~_summary_row_mask(body, sector_col=0)
 
-    # Identify and remove summary columns
-    summary_col_indices = identify_summary_columns(df_clean, header_row=0)
+    # Identify summary columns on the first remaining row
+    remaining = np.flatnonzero(non_summary)
+    if len(remaining):
+        summary_col_indices = identify_summary_columns(body.iloc[remaining[:1]], header_row=0)
+    else:
+        summary_col_indices = []
 
     # Assume last 10 columns are also summary columns
-    try:
-        potential_summary_cols = list(df_clean.columns[-10:])
-        potential_summary_cols = [col for col in potential_summary_cols if isinstance(col, int)]
-        summary_col_indices = sorted(set(summary_col_indices + potential_summary_cols))
-    except:
-        pass
+    potential_summary_cols = [col for col in body.columns[-10:] if isinstance(col, int)]
+    summary_col_indices = set(summary_col_indices + potential_summary_cols)
 
     # Delete except first data_start_col columns
-    summary_col_indices = [col for col in summary_col_indices if isinstance(col, int) and col >= data_start_col]
-    if summary_col_indices:
-        df_clean = df_clean.drop(columns=summary_col_indices, errors='ignore')
+    keep_cols = [pos for pos, col in enumerate(body.columns)
+                 if not (col in summary_col_indices and isinstance(col, int) and col >= data_start_col)]
 
     # Remove NaN rows (Based on region/sector code)
+    keep_rows = non_summary & body[0].notna().to_numpy()
     if is_regional:
-        df_clean = df_clean.dropna(subset=[0, 1], how='any')
-    else:
-        df_clean = df_clean.dropna(subset=[0], how='any')
+        keep_rows &= body[1].notna().to_numpy()
+
+    df_clean = body.iloc[np.flatnonzero(keep_rows), keep_cols]
+
+    # Row labels count only the non-summary rows, as after drop + reset_index
+    df_clean.index = (np.cumsum(non_summary) - 1)[keep_rows]
 
     return df_clean
 
 
+def _header_strings(df_raw: pd.DataFrame, row: int, start_col: int) -> np.ndarray:
+    """
+    Header cells of one raw row as stripped strings (str() of each cell)
+    """
+    cells = df_raw.iloc[row, start_col:].to_numpy(dtype=object)
+    return np.char.strip(cells.astype(str))
+
+
+def extract_input_headers(df_raw: pd.DataFrame, is_regional: bool = False) -> Dict[str, np.ndarray]:
+    """
+    Extract input sector info (one entry per data column) from raw header rows
+
+    Regional table: rows 4=입력Regional, 5=입력섹터코드, 6=입력섹터명 (from column 3)
+    National table: rows 4=입력섹터코드, 5=입력섹터명 (from column 2, only
+                    columns where both are present)
+
+    Parameters:
+    -----------
+    df_raw : pd.DataFrame
+        정제 전 원본 데이터
+    is_regional : bool
+        Whether regional table
+
+    Returns:
+    --------
+    Dict[str, np.ndarray]
+        Long-format column name -> header values
+    """
+    empty = np.array([], dtype=str)
+
+    if is_regional:
+        if df_raw is None or len(df_raw) <= 6:
+            return {'input_region': empty, 'input_sector_code': empty, 'input_sector_name': empty}
+        return {
+            'input_region': _header_strings(df_raw, 4, 3),
+            'input_sector_code': _header_strings(df_raw, 5, 3),
+            'input_sector_name': _header_strings(df_raw, 6, 3),
+        }
+
+    if df_raw is None or len(df_raw) <= 5:
+        return {'input_sector_code': empty, 'input_sector_name': empty}
+
+    # National 테이블: skip columns missing either the code or the name
+    present = (df_raw.iloc[4, 2:].notna() & df_raw.iloc[5, 2:].notna()).to_numpy(dtype=bool)
+    return {
+        'input_sector_code': _header_strings(df_raw, 4, 2)[present],
+        'input_sector_name': _header_strings(df_raw, 5, 2)[present],
+    }
+
+
+def _gather_input_info(values: np.ndarray, input_idx: np.ndarray) -> np.ndarray:
+    """
+    Look up input sector info by position for every long-format row
+
+    Parameters:
+    -----------
+    values : np.ndarray
+        Input header values, one per data column
+    input_idx : np.ndarray
+        Position of each row's input column among the data columns
+
+    Returns:
+    --------
+    np.ndarray
+        Object array of values, None where the position is out of range
+    """
+    out = np.full(len(input_idx), None, dtype=object)
+    valid = (input_idx >= 0) & (input_idx < len(values))
+    out[valid] = np.asarray(values, dtype=object)[input_idx[valid]]
+    return out
+
+
 def io_table_to_long(df: pd.DataFrame,
                      df_raw: pd.DataFrame = None,
                      sheet_name: str = None,
@@ -267,99 +379,45 @@ def io_table_to_long(df: pd.DataFrame,
         Long-format dataframe
     """
 
-    if is_regional:
-        # ===== Process Regional Table =====
-        # Extract input sector info from raw data
-        input_regions = []
-        input_codes = []
-        input_names = []
-
-        if df_raw is not None and len(df_raw) > 6:
-            for col_idx in range(3, len(df_raw.columns)):
-                input_regions.append(str(df_raw.iloc[4, col_idx]).strip())
-                input_codes.append(str(df_raw.iloc[5, col_idx]).strip())
-                input_names.append(str(df_raw.iloc[6, col_idx]).strip())
-
-        # Column 0=Regional, 1=섹터코드, 2=섹터명으로 인덱스 설정
-        df_indexed = df.set_index([0, 1, 2])
-        df_indexed.index.names = ['output_region', 'output_sector_code', 'output_sector_name']
-
-        # melt() 사용하여 길형식으로 변환
-        df_long = df_indexed.stack().reset_index()
-        df_long.columns = ['output_region', 'output_sector_code', 'output_sector_name',
-                          'input_column_idx', 'value']
-
-        # Map input sector info (column index가 3부터 시작하므로 조정)
-        df_long['input_column_idx_num'] = pd.to_numeric(df_long['input_column_idx'], errors='coerce')
-        df_long['input_idx'] = (df_long['input_column_idx_num'] - 3).astype(int)
-
-        # 범위 내의 Input info만 추가
-        df_long['input_region'] = df_long['input_idx'].apply(
-            lambda x: input_regions[x] if 0 <= x < len(input_regions) else None
-        )
-        df_long['input_sector_code'] = df_long['input_idx'].apply(
-            lambda x: input_codes[x] if 0 <= x < len(input_codes) else None
-        )
-        df_long['input_sector_name'] = df_long['input_idx'].apply(
-            lambda x: input_names[x] if 0 <= x < len(input_names) else None
-        )
-
-        # Remove unnecessary columns
-        df_long = df_long.drop(columns=['input_column_idx', 'input_column_idx_num', 'input_idx'])
+    # Input sector info comes from the raw header rows
+    input_info = extract_input_headers(df_raw, is_regional)
 
+    if is_regional:
+        # Column 0=Regional, 1=섹터코드, 2=섹터명
+        index_cols = [0, 1, 2]
+        output_names = ['output_region', 'output_sector_code', 'output_sector_name']
     else:
-        # ===== Process National Table =====
-        # Extract input sector info from raw data
-        input_codes = []
-        input_names = []
-
-        if df_raw is not None and len(df_raw) > 5:
-            # National 테이블의 헤더 구조 파악
-            for col_idx in range(2, len(df_raw.columns)):
-                try:
-                    code_val = df_raw.iloc[4, col_idx]
-                    name_val = df_raw.iloc[5, col_idx]
-                    if pd.notna(code_val) and pd.notna(name_val):
-                        input_codes.append(str(code_val).strip())
-                        input_names.append(str(name_val).strip())
-                except:
-                    pass
-
-        # Column 0=섹터코드, 1=섹터명으로 인덱스 설정
-        df_indexed = df.set_index([0, 1])
-        df_indexed.index.names = ['output_sector_code', 'output_sector_name']
-
-        # melt() 사용하여 길형식으로 변환
-        df_long = df_indexed.stack().reset_index()
-        df_long.columns = ['output_sector_code', 'output_sector_name',
-                          'input_column_idx', 'value']
-
-        # Map input sector info (column index가 2부터 시작하므로 조정)
-        df_long['input_column_idx_num'] = pd.to_numeric(df_long['input_column_idx'], errors='coerce')
-        df_long['input_idx'] = (df_long['input_column_idx_num'] - 2).astype(int)
-
-        # 범위 내의 Input info만 추가
-        df_long['input_sector_code'] = df_long['input_idx'].apply(
-            lambda x: input_codes[x] if 0 <= x < len(input_codes) else None
-        )
-        df_long['input_sector_name'] = df_long['input_idx'].apply(
-            lambda x: input_names[x] if 0 <= x < len(input_names) else None
-        )
-
-        # Remove unnecessary columns
-        df_long = df_long.drop(columns=['input_column_idx', 'input_column_idx_num', 'input_idx'])
-
-    # Convert to numeric format
-    df_long['value'] = pd.to_numeric(df_long['value'], errors='coerce')
-
-    # 0 or NaN values (Include only actual transactions)
-    df_long = df_long[df_long['value'] > 0].copy()
+        # Column 0=섹터코드, 1=섹터명
+        index_cols = [0, 1]
+        output_names = ['output_sector_code', 'output_sector_name']
+
+    # Build the long format straight from the value block, keeping only
+    # actual transactions (0 or NaN cells are never materialized); nonzero()
+    # walks the block row-major, the same order as stack()
+    data_cols = df.columns.drop(index_cols)
+    block = df[data_cols]
+    try:
+        values = block.to_numpy(dtype=np.float64)
+    except (TypeError, ValueError):
+        # Text cells present: coerce column by column (non-numeric -> NaN)
+        values = block.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+    row_pos, col_pos = np.nonzero(values > 0)
+
+    # Input info is looked up by column label (data columns start after index_cols)
+    input_pos = pd.to_numeric(data_cols).to_numpy().astype(int) - len(index_cols)
+
+    long_cols = {name: df[col].to_numpy()[row_pos]
+                 for name, col in zip(output_names, index_cols)}
+    long_cols['value'] = values[row_pos, col_pos]
+    for name, info in input_info.items():
+        long_cols[name] = _gather_input_info(info, input_pos)[col_pos]
+    df_long = pd.DataFrame(long_cols)
 
     # Add sheet source (renamed to 'table')
     if sheet_name:
         df_long['table'] = sheet_name
 
-    return df_long.reset_index(drop=True)
+    return df_long
 
 
 def detect_geographical_level(file_path: str) -> Tuple[str, bool]:
@@ -373,6 +431,24 @@ def detect_geographical_level(file_path: str) -> Tuple[str, bool]:
     return level, is_regional
 
 
+def _convert_sheet(df_raw: pd.DataFrame, sheet_name: str, is_regional: bool) -> pd.DataFrame:
+    """
+    Clean one raw sheet and convert it to long format (empty if no data)
+    """
+    if df_raw.empty:
+        return pd.DataFrame()
+
+    # 정제 (Determine regional/national based on filename)
+    df_clean = clean_io_table(df_raw, is_regional=is_regional)
+
+    if len(df_clean) < 2:  # Must have at least 2 data rows
+        return pd.DataFrame()
+
+    # 길형식으로 변환 (원본 데이터도 함께 전달)
+    return io_table_to_long(df_clean, df_raw=df_raw, sheet_name=sheet_name,
+                            is_regional=is_regional)
+
+
 def process_excel_file(file_path: str,
                       sector_code_col: int = 0,
                       sector_name_col: int = 1) -> Tuple[pd.DataFrame, Dict]:
@@ -402,31 +478,22 @@ def process_excel_file(file_path: str,
     geographical_level, is_regional_file = detect_geographical_level(file_path)
 
     try:
-        xl_file = pd.ExcelFile(file_path)
-        print(f"\n파일: {Path(file_path).name}")
-        print(f"Geographical level: {geographical_level}")
-        print(f"Number of sheets: {len(xl_file.sheet_names)}")
-        print(f"Sheet list: {xl_file.sheet_names[:5]}")
-        if len(xl_file.sheet_names) > 5:
-            print(f"  ... 외 {len(xl_file.sheet_names) - 5}개 시트")
-
-        for sheet_name in xl_file.sheet_names:
+        # Open the workbook once; every sheet is parsed from this handle,
+        # which is closed again even when parsing fails
+        with pd.ExcelFile(file_path, engine=EXCEL_ENGINE) as xl_file:
+            print(f"\n파일: {Path(file_path).name}")
+            print(f"Geographical level: {geographical_level}")
+            print(f"Number of sheets: {len(xl_file.sheet_names)}")
+            print(f"Sheet list: {xl_file.sheet_names[:5]}")
+            if len(xl_file.sheet_names) > 5:
+                print(f"  ... 외 {len(xl_file.sheet_names) - 5}개 시트")
+
+            # Read every sheet in one pass (원본과 정제본 모두 필요)
+            all_sheets = xl_file.parse(sheet_name=None, header=None)
+
+        for sheet_name, df_raw in all_sheets.items():
             try:
-                # Read sheet (원본과 정제본 모두 필요)
-                df_raw = pd.read_excel(file_path, sheet_name=sheet_name, header=None)
-
-                if df_raw.empty:
-                    continue
-
-                # 정제 (Determine regional/national based on filename)
-                df_clean = clean_io_table(df_raw, is_regional=is_regional_file)
-
-                if len(df_clean) < 2:  # Must have at least 2 data rows
-                    continue
-
-                # 길형식으로 변환 (원본 데이터도 함께 전달)
-                df_long = io_table_to_long(df_clean, df_raw=df_raw, sheet_name=sheet_name,
-                                          is_regional=is_regional_file)
+                df_long = _convert_sheet(df_raw, sheet_name, is_regional_file)
 
                 if len(df_long) > 0:
                     # Geographical level 추가
@@ -455,10 +522,127 @@ def process_excel_file(file_path: str,
     return df_combined, stats
 
 
+def list_excel_files(folder: Path) -> List[str]:
+    """
+    Sorted names of the .xlsx files directly inside folder
+
+    Sorted so that "the first N files" does not depend on directory
+    order. os.scandir reuses the file type from readdir, so no Path
+    object or extra stat is made per entry.
+    """
+    with os.scandir(folder) as entries:
+        return sorted(entry.name for entry in entries
+                      if entry.name.endswith('.xlsx') and entry.is_file())
+
+
+def process_excel_files(file_paths: List[str],
+                        max_workers: int = None) -> List[Tuple[pd.DataFrame, Dict]]:
+    """
+    Process several Excel files, one worker process per file
+
+    Parameters:
+    -----------
+    file_paths : List[str]
+        Excel File paths
+    max_workers : int
+        Worker processes (None = CPU count); each worker opens its own workbook
+
+    Returns:
+    --------
+    List[Tuple[pd.DataFrame, Dict]]
+        process_excel_file results, in file_paths order
+    """
+    file_paths = [str(file_path) for file_path in file_paths]
+    workers = min(max_workers or os.cpu_count() or 1, len(file_paths))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(process_excel_file, file_paths))
+    return [process_excel_file(file_path) for file_path in file_paths]
+
+
+def sample_per_table(df_long: pd.DataFrame, table_col: str, n_rows: int = 10000) -> pd.DataFrame:
+    """
+    Keep the first n_rows rows of each table, tables in order of appearance
+
+    Tables are factorized to int64 codes once; a stable argsort groups the
+    rows per table and each row's rank within its table selects the sample.
+
+    Parameters:
+    -----------
+    df_long : pd.DataFrame
+        Combined long-format dataframe
+    table_col : str
+        Column identifying the source table/sheet
+    n_rows : int
+        Rows to keep per table
+
+    Returns:
+    --------
+    pd.DataFrame
+        Sampled dataframe (rows with a missing table are dropped)
+    """
+    codes, _ = pd.factorize(df_long[table_col], sort=False)
+    order = np.argsort(codes, kind='stable')
+    order = order[codes[order] >= 0]
+
+    counts = np.bincount(codes[order])
+    rank = np.arange(len(order)) - np.repeat(np.cumsum(counts) - counts, counts)
+    return df_long.take(order[rank < n_rows]).reset_index(drop=True)
+
+
 # ============================================================================
 # 3. Two Long-Format DataFrame Creation Functions
 # ============================================================================
 
+def _join_unique(index_df: pd.DataFrame, col: str) -> pd.Series:
+    """
+    Sorted, comma separated unique non-null values of col per sector_code
+
+    Values are ranked with np.unique and each (sector, value rank) pair is
+    encoded as one integer, so a second np.unique yields the distinct pairs
+    grouped by sector and sorted by value; joining only touches those.
+    """
+    pairs = index_df[['sector_code', col]].dropna(subset=[col])
+    if pairs.empty:
+        return pd.Series(dtype=object)
+
+    sector_ids, sectors = pd.factorize(pairs['sector_code'])
+    values, value_ranks = np.unique(pairs[col].astype(str).to_numpy(dtype=object),
+                                    return_inverse=True)
+    keys = np.unique(sector_ids * len(values) + value_ranks.ravel())
+    key_sectors = keys // len(values)
+    key_values = values[keys % len(values)]
+
+    # Split the pair list at every sector change and join each run
+    starts = np.flatnonzero(np.diff(key_sectors)) + 1
+    joined = [', '.join(run) for run in np.split(key_values, starts)]
+    return pd.Series(joined, index=sectors[key_sectors[np.r_[0, starts]]])
+
+
+def select_columns(df_long: pd.DataFrame, columns: Tuple[str, ...]) -> pd.DataFrame:
+    """
+    Project df_long onto the listed columns that it actually has
+    """
+    return df_long[[col for col in columns if col in df_long.columns]]
+
+
+def compact_long_dtypes(df_long: pd.DataFrame) -> pd.DataFrame:
+    """
+    Shrink df_long in place: 'value' to float32 when that is lossless, and
+    the low-cardinality label columns to category
+    """
+    if df_long['value'].dtype == np.float64:
+        values_32 = df_long['value'].astype(np.float32)
+        if np.array_equal(values_32.to_numpy(np.float64), df_long['value'].to_numpy(), equal_nan=True):
+            df_long['value'] = values_32
+
+    for col in ('table', 'geographical_level'):
+        if col in df_long.columns:
+            df_long[col] = df_long[col].astype('category')
+
+    return df_long
+
+
 def create_index_dataframe(df_long: pd.DataFrame) -> pd.DataFrame:
     """
     첫 번째 데이터프레임: Index information
@@ -503,15 +687,32 @@ def create_index_dataframe(df_long: pd.DataFrame) -> pd.DataFrame:
     index_df_grouped = index_df.groupby('sector_code', as_index=False).agg({
         'sector_name': 'first',
         'sector_type': 'first',
-        'geographical_level': lambda x: ', '.join(sorted(set(x))),
-        'region': lambda x: ', '.join(sorted(set([str(r) for r in x if pd.notna(r)]))) or None
     })
 
+    # Geographical levels / regions: collate the unique values of each sector
+    for col in ['geographical_level', 'region']:
+        joined = _join_unique(index_df, col)
+        index_df_grouped[col] = index_df_grouped['sector_code'].map(joined) if len(joined) else None
+
     index_df_grouped = index_df_grouped.sort_values(['sector_code']).reset_index(drop=True)
 
     return index_df_grouped
 
 
+def _sort_order(df: pd.DataFrame, sort_cols: List[str]) -> np.ndarray:
+    """
+    Row positions that sort df by sort_cols (ascending, stable, NaN last)
+
+    Each column is ranked by its sorted category codes and the ranks are
+    ordered with one np.lexsort, like a multi-column sort_values.
+    """
+    keys = []
+    for col in reversed(sort_cols):
+        codes, uniques = pd.factorize(df[col], sort=True)
+        keys.append(np.where(codes < 0, len(uniques), codes))
+    return np.lexsort(keys)
+
+
 def create_transaction_dataframe(df_long: pd.DataFrame) -> pd.DataFrame:
     """
     두 번째 데이터프레임: Transaction data
@@ -524,14 +725,14 @@ def create_transaction_dataframe(df_long: pd.DataFrame) -> pd.DataFrame:
     마지막: value: Transaction amount
     """
 
-    # Remove NaN and sort
-    df_trans = df_long.dropna(subset=['value']).copy()
+    # Remove NaN
+    df_trans = df_long.dropna(subset=['value'])
 
     # Sort output sectors (Based on region/country)
     if 'output_region' in df_trans.columns:
-        df_trans = df_trans.sort_values(['output_region', 'output_sector_code', 'input_region', 'input_sector_code'])
+        sort_cols = ['output_region', 'output_sector_code', 'input_region', 'input_sector_code']
     else:
-        df_trans = df_trans.sort_values(['output_sector_code', 'input_sector_code'])
+        sort_cols = ['output_sector_code', 'input_sector_code']
 
     # Sort column order
     cols_order = ['geographical_level', 'table']
@@ -553,7 +754,9 @@ def create_transaction_dataframe(df_long: pd.DataFrame) -> pd.DataFrame:
 
     # Select only existing columns
     cols_order = [col for col in cols_order if col in df_trans.columns]
-    df_trans = df_trans[cols_order]
+
+    # Reorder columns and rows with a single take
+    df_trans = df_trans[cols_order].take(_sort_order(df_trans, sort_cols))
 
     return df_trans.reset_index(drop=True)
 
@@ -562,9 +765,14 @@ def create_transaction_dataframe(df_long: pd.DataFrame) -> pd.DataFrame:
 # 4. Main Execution Function
 # ============================================================================
 
-def main():
+def main(excel_compat: bool = False):
     """
     메인 실행 함수
+
+    Parameters:
+    -----------
+    excel_compat : bool
+        Write CSVs as UTF-8 with BOM (utf-8-sig) so Excel detects the encoding
     """
 
     print("\n" + "="*70)
@@ -614,52 +822,64 @@ df_long = df.reset_index().melt(
     else:
         print(f"\n{rawdata_path} 폴더의 Excel 파일 처리 중...")
 
-        excel_files = list(rawdata_path.glob('*.xlsx'))
-        print(f"Found Excel files: {len(excel_files)}개")
+        excel_names = list_excel_files(rawdata_path)
+        excel_files = [rawdata_path / name for name in excel_names[:3]]
+        print(f"Found Excel files: {len(excel_names)}개")
 
         all_data = []
         all_stats = []
 
-        # 주요 파일 처리 (처음 3개 파일)
-        for file_path in excel_files[:3]:
-            df_long, stats = process_excel_file(str(file_path))
-            all_data.append(df_long)
+        # 주요 파일 처리 (처음 3개 파일), in parallel across files
+        for df_long, stats in process_excel_files(excel_files):
             all_stats.append(stats)
+            # Failed workbooks come back as an empty frame without columns
+            if len(df_long) > 0:
+                all_data.append(df_long)
 
         if all_data:
-            # Combine data from all files
-            df_combined_long = pd.concat(all_data, ignore_index=True)
+            total_rows = sum(len(df_long) for df_long in all_data)
+            print(f"\n전체 결합 데이터: {total_rows:,} 행")
 
-            print(f"\n전체 결합 데이터: {len(df_combined_long):,} 행")
+            # Sample by sheet/table
+            table_col = 'table' if any('table' in df_long.columns for df_long in all_data) else 'source_sheet'
 
             # 샘플링 (대용량 데이터 처리 시)
-            if len(df_combined_long) > 1000000:
+            # Each file is capped before combining so the full data is never
+            # concatenated. The same sheet name can occur in several files
+            # (e.g. one workbook per year), so the capped frames are sampled
+            # once more after the concat to keep 10,000 rows per table overall;
+            # that second pass only sees at most 10,000 rows per table per file
+            is_large = total_rows > 1000000
+            if is_large:
                 print(f"Large dataset detected (> 1백만 행)")
                 print("Sampling top 10,000 rows per sheet to reduce processing time...")
+                all_data = [sample_per_table(df_long, table_col, 10000) for df_long in all_data]
 
-                # Sample by sheet/table
-                sampled_data = []
-                table_col = 'table' if 'table' in df_combined_long.columns else 'source_sheet'
-                for table_name in df_combined_long[table_col].unique():
-                    sheet_data = df_combined_long[df_combined_long[table_col] == table_name]
-                    sheet_sample = sheet_data.head(10000)
-                    sampled_data.append(sheet_sample)
+            # Combine data from all files
+            df_combined_long = compact_long_dtypes(pd.concat(all_data, ignore_index=True))
+            del all_data
 
-                df_combined_long = pd.concat(sampled_data, ignore_index=True)
+            if is_large:
+                df_combined_long = sample_per_table(df_combined_long, table_col, 10000)
                 print(f"Data after sampling: {len(df_combined_long):,} 행\n")
 
             # 두 가지 Long-format dataframe 생성
             print("\n" + "-"*70)
             print("Creating index dataframe...")
-            df_index = create_index_dataframe(df_combined_long)
+            df_index = create_index_dataframe(select_columns(df_combined_long, INDEX_COLS))
             print(f"✓ Complete: {len(df_index):,} sectors/products")
             print(df_index.head(10))
 
             print("\n" + "-"*70)
             print("Transaction data프레임 생성 중...")
-            df_transaction = create_transaction_dataframe(df_combined_long)
+            df_transaction = create_transaction_dataframe(select_columns(df_combined_long, TRANSACTION_COLS))
+            # Back to float64 for saving: to_csv prints float32 with float32
+            # precision (1234567.125 -> 1.2345671e+06); the widening is exact
+            df_transaction['value'] = df_transaction['value'].astype(np.float64)
             print(f"✓ Complete: {len(df_transaction):,} transaction records")
-            print(df_transaction.head(10))
+            # Bound the preview to 8 columns so the repr stays cheap for wide frames
+            with pd.option_context('display.max_columns', 8, 'display.width', 120):
+                print(df_transaction.head(10))
 
             # CSV로 저장
             print("\n" + "-"*70)
@@ -672,12 +892,26 @@ df_long = df.reset_index().melt(
             index_path = data_dir / 'io_index_dataframe.csv'
             transaction_path = data_dir / 'io_transaction_dataframe.csv'
 
-            df_index.to_csv(index_path, index=False, encoding='utf-8-sig')
-            df_transaction.to_csv(transaction_path, index=False, encoding='utf-8-sig')
+            # Plain UTF-8 unless Excel compatibility (BOM) is requested;
+            # readers in this project accept both
+            csv_options = {
+                'index': False,
+                'encoding': 'utf-8-sig' if excel_compat else 'utf-8',
+                'lineterminator': '\n',
+            }
+            df_index.to_csv(index_path, **csv_options)
+            df_transaction.to_csv(transaction_path, **csv_options)
 
             print(f"✓ {index_path}")
             print(f"✓ {transaction_path}")
 
+            # Arrow IPC copies: read back without text parsing or
+            # decompression (the analysis and sector_finder prefer them)
+            for df_out, csv_path in ((df_index, index_path), (df_transaction, transaction_path)):
+                arrow_path = write_binary_copy(df_out, csv_path, suffix='.arrow')
+                if arrow_path:
+                    print(f"✓ {arrow_path}")
+
     # ========== 최종 요약 ==========
     print("\n\n" + "="*70)
     print("처리 Complete")
@@ -702,4 +936,10 @@ df_long = df.reset_index().melt(
 # ============================================================================
 
 if __name__ == '__main__':
-    main()
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Convert Korean IO tables to long format')
+    parser.add_argument('--excel-compat', action='store_true',
+                        help='write CSVs with a UTF-8 BOM for Excel')
+    args = parser.parse_args()
+    main(excel_compat=args.excel_compat)
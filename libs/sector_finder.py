@@ -4,6 +4,44 @@ Finds sector codes by sector name keyword
 """
 
 import pandas as pd
+from functools import lru_cache
+from pathlib import Path
+
+from .table_io import HAS_PYARROW, read_table, resolve_table_path
+
+# Arrow-backed strings run substring search in a compiled kernel
+STRING_DTYPE = 'string[pyarrow]' if HAS_PYARROW else 'string'
+
+# Columns the search needs; only these are read from the index table
+INDEX_COLUMNS = ['sector_code', 'sector_name', 'sector_type', 'geographical_level']
+
+
+def _load_index(csv_path: str = 'data/io_index_dataframe.csv') -> pd.DataFrame:
+    """
+    Load the sector index for searching, memoized across calls
+
+    The cache is keyed by the file actually read and its modification
+    time/size, so a re-run of the converter is picked up.
+    """
+    path = resolve_table_path(csv_path)
+    stat = Path(path).stat()
+    return _load_index_cached(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=1)
+def _load_index_cached(path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """
+    Read the index columns and convert them to compact search dtypes
+
+    Only this converted frame is cached; the raw table is read past the
+    read_table cache so the index isn't held twice.
+    """
+    df_index = read_table(path, columns=INDEX_COLUMNS, cache=False)
+    return df_index.astype({
+        'sector_name': STRING_DTYPE,
+        'sector_type': 'category',
+        'geographical_level': 'category',
+    })
 
 
 def find_sector_by_name(sector_name_keyword):
@@ -20,14 +58,12 @@ def find_sector_by_name(sector_name_keyword):
     pd.DataFrame
         Matching sectors with codes and names
     """
-    df_index = pd.read_csv(
-        'data/io_index_dataframe.csv',
-        encoding='utf-8-sig'
-    )
-
-    # Search for sector name containing keyword
-    mask = df_index['sector_name'].str.contains(sector_name_keyword, na=False)
-    results = df_index[mask][['sector_code', 'sector_name', 'sector_type', 'geographical_level']].drop_duplicates()
+    # Prefers an up-to-date Parquet/Arrow copy of the CSV when one exists
+    df_index = _load_index()
+
+    # Search for sector name containing keyword (plain substring, not regex)
+    mask = df_index['sector_name'].str.contains(sector_name_keyword, regex=False, na=False).to_numpy(dtype=bool)
+    results = df_index[mask][INDEX_COLUMNS].drop_duplicates()
     results = results.sort_values('sector_code')
 
     return results
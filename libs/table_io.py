@@ -0,0 +1,204 @@
+"""
+Table file I/O shared by the converter and the analysis libraries
+- Read CSV / Parquet / Arrow IPC tables (latest version of each file cached)
+- Locate and write binary copies next to CSV tables
+"""
+
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import pyarrow
+    HAS_PYARROW = True
+    # ArrowInvalid, ArrowNotImplementedError, ... raised while converting
+    ARROW_ERRORS = (pyarrow.ArrowException,)
+except ImportError:
+    HAS_PYARROW = False
+    ARROW_ERRORS = ()
+
+CSV_ENGINE = 'pyarrow' if HAS_PYARROW else 'c'
+
+# read_table cache: (resolved path, columns) -> ((mtime_ns, size), table)
+_TABLE_CACHE: Dict[Tuple, Tuple[Tuple[int, int], pd.DataFrame]] = {}
+
+BINARY_SUFFIXES = ('.parquet', '.arrow', '.feather')
+
+# pandas' default NA tokens (read_csv na_values); 'nan' etc. appear in the
+# converter's CSVs and must read as missing in every reader
+CSV_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None',
+    'n/a', 'nan', 'null',
+]
+
+
+def read_table(path: str, columns: Optional[List[str]] = None,
+               cache: bool = True) -> pd.DataFrame:
+    """
+    Read a table produced by this project
+
+    Parquet and Arrow IPC (.arrow/.feather) files are read directly
+    without any text parsing. CSV files (UTF-8-SIG) use the
+    multi-threaded pyarrow parser when pyarrow is installed, otherwise
+    the default pandas C parser.
+
+    Results are cached per file path, holding only the latest version of
+    each file: repeated reads of an unchanged file within one process skip
+    parsing, and a rewritten file replaces its old entry. Callers get a
+    shallow copy and can add or replace columns freely.
+
+    Parameters
+    ----------
+    path : str
+        Path to CSV, Parquet or Arrow IPC file
+    columns : list of str, optional
+        Read only these columns (pushed down into the file reader)
+    cache : bool
+        Use the cache; False parses the file without storing the result
+
+    Returns
+    -------
+    pd.DataFrame
+        Loaded table
+    """
+    path = Path(path).resolve()
+    columns = tuple(columns) if columns is not None else None
+    if not cache:
+        return _parse_table(path, columns)
+
+    stat = path.stat()
+    version = (stat.st_mtime_ns, stat.st_size)
+    key = (path, columns)
+    cached = _TABLE_CACHE.get(key)
+    if cached is None or cached[0] != version:
+        # Drop the stale entry before parsing so both versions aren't held
+        _TABLE_CACHE.pop(key, None)
+        cached = _TABLE_CACHE[key] = (version, _parse_table(path, columns))
+    return cached[1].copy(deep=False)
+
+
+def _parse_table(path: Path, columns: Optional[Tuple[str, ...]] = None) -> pd.DataFrame:
+    """
+    Parse a table file with the reader for its suffix
+    """
+    columns = list(columns) if columns is not None else None
+    if path.suffix == '.parquet':
+        return pd.read_parquet(path, columns=columns)
+    if path.suffix in ('.arrow', '.feather'):
+        return pd.read_feather(path, columns=columns)
+    return pd.read_csv(path, encoding='utf-8-sig', engine=CSV_ENGINE, usecols=columns)
+
+
+def resolve_table_path(csv_path: str) -> Path:
+    """
+    Return an up-to-date binary copy of a CSV table if one exists
+
+    A binary copy is used only when it is at least as new as the CSV,
+    so a stale copy from an earlier run is never picked up.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to CSV file; other paths are returned unchanged
+
+    Returns
+    -------
+    Path
+        Path of the binary copy, or the CSV path itself
+    """
+    csv_path = Path(csv_path)
+    if csv_path.suffix != '.csv':
+        return csv_path
+    csv_mtime = csv_path.stat().st_mtime_ns if csv_path.exists() else -1
+    for suffix in BINARY_SUFFIXES:
+        candidate = csv_path.with_suffix(suffix)
+        if candidate.exists() and candidate.stat().st_mtime_ns >= csv_mtime:
+            return candidate
+    return csv_path
+
+
+def _as_read_from_csv(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Give df the values and dtypes read_csv returns for its CSV
+
+    int64/float64/bool columns round-trip unchanged and other numeric
+    columns are cast as their text parses. Every other column is
+    converted once per distinct value (factorize codes pick the rows):
+    NA tokens become missing, columns whose text is all numeric become
+    int64/float64 (float64 when values are missing), the rest stay text.
+    """
+    df = df.copy(deep=False)
+    for col in df.columns:
+        values = df[col]
+        if values.dtype in ('int64', 'float64', 'bool'):
+            continue
+        if values.dtype == np.float32:
+            # to_csv prints float32 digits, read back as float64. Whole
+            # numbers up to 2**24 (and NaN) print exactly and are widened
+            # directly; only the others are parsed from their digits
+            values_32 = values.to_numpy()
+            widened = values_32.astype(np.float64)
+            printed = ~(((widened == np.round(widened)) & (np.abs(widened) <= 2 ** 24))
+                        | np.isnan(widened))
+            widened[printed] = values_32[printed].astype(str).astype(np.float64)
+            df[col] = widened
+            continue
+        if pd.api.types.is_integer_dtype(values.dtype):
+            df[col] = values.astype(np.float64 if values.hasnans else np.int64)
+            continue
+        if pd.api.types.is_float_dtype(values.dtype):
+            df[col] = values.to_numpy(dtype=np.float64, na_value=np.nan)
+            continue
+
+        codes, uniques = pd.factorize(values)
+        if len(uniques) == 0:
+            df[col] = np.nan  # An empty column reads as all-NaN float64
+            continue
+        text = pd.Series(np.asarray(uniques, dtype=object)).map(str)
+        text = text.where(~text.isin(CSV_NA_VALUES), None)
+        try:
+            parsed = pd.to_numeric(text)
+        except (ValueError, TypeError):
+            parsed = text
+        missing = codes < 0
+        if parsed.isna().any() or missing.any():
+            if pd.api.types.is_integer_dtype(parsed.dtype):
+                parsed = parsed.astype(np.float64)
+            # Missing rows take the NA appended after the distinct values
+            codes = np.where(missing, len(parsed), codes)
+            na = np.nan if pd.api.types.is_numeric_dtype(parsed.dtype) else None
+            parsed = pd.concat([parsed, pd.Series([na], dtype=parsed.dtype)], ignore_index=True)
+        df[col] = parsed.to_numpy()[codes]
+    return df
+
+
+def write_binary_copy(df: pd.DataFrame, csv_path: Path,
+                      suffix: str = '.parquet') -> Optional[Path]:
+    """
+    Write a binary copy of a table next to the CSV it was saved as
+
+    suffix '.parquet' writes Snappy-compressed Parquet; '.arrow' or
+    '.feather' writes Arrow IPC (Feather v2). The copy holds what
+    read_csv returns for the CSV, so either file gives the same table.
+    Returns None, after printing why, when pyarrow is not installed or
+    the frame cannot be stored.
+    """
+    binary_path = Path(csv_path).with_suffix(suffix)
+    if not HAS_PYARROW:
+        print(f"⚠ {binary_path} not written (requires pyarrow)")
+        return None
+
+    df = _as_read_from_csv(df)
+    try:
+        if suffix == '.parquet':
+            df.to_parquet(binary_path, index=False, compression='snappy')
+        else:
+            df.reset_index(drop=True).to_feather(binary_path)
+    except (TypeError, ValueError, *ARROW_ERRORS) as e:
+        # Don't leave a partially written file behind
+        binary_path.unlink(missing_ok=True)
+        print(f"⚠ {binary_path} not written: {type(e).__name__}: {e}")
+        return None
+    return binary_path
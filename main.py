@@ -46,6 +46,24 @@ Operations:
     return choice
 
 
+# Menu choice -> (banner title, action)
+ACTIONS = {
+    "1": ("Starting Data Conversion", run_conversion),
+    "2": ("Starting IO Table Analysis", lambda: run_analysis('config.json')),
+    "3": ("Starting Economic Impact Calculation", run_impact_calculation),
+    "4": ("Starting Sector Finder", run_sector_finder),
+}
+
+
+def print_banner(title):
+    """
+    Print a section banner
+    """
+    print("\n" + "="*70)
+    print(title)
+    print("="*70)
+
+
 def main():
     """
     Main menu loop
@@ -53,34 +71,13 @@ def main():
     while True:
         choice = show_menu()
 
-        if choice == "1":
-            print("\n" + "="*70)
-            print("Starting Data Conversion")
-            print("="*70)
-            run_conversion()
-
-        elif choice == "2":
-            print("\n" + "="*70)
-            print("Starting IO Table Analysis")
-            print("="*70)
-            run_analysis('config.json')
-
-        elif choice == "3":
-            print("\n" + "="*70)
-            print("Starting Economic Impact Calculation")
-            print("="*70)
-            run_impact_calculation()
-
-        elif choice == "4":
-            print("\n" + "="*70)
-            print("Starting Sector Finder")
-            print("="*70)
-            run_sector_finder()
+        if choice in ACTIONS:
+            title, action = ACTIONS[choice]
+            print_banner(title)
+            action()
 
         elif choice == "0":
-            print("\n" + "="*70)
-            print("Goodbye!")
-            print("="*70)
+            print_banner("Goodbye!")
             break
 
         else:
@@ -89,9 +86,7 @@ def main():
         # Ask to continue
         cont = input("\nPress Enter to continue or 'q' to quit: ").strip().lower()
         if cont == 'q':
-            print("\n" + "="*70)
-            print("Goodbye!")
-            print("="*70)
+            print_banner("Goodbye!")
             break
 
 
@@ -0,0 +1,166 @@
+"""
+The polars analysis engine must give the same results as the pandas engine,
+from the CSV or its binary copy
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from libs.io_analyzer import analyze_backward, analyze_forward, apply_filters, run_analysis
+from libs.table_io import HAS_PYARROW, write_binary_copy
+
+try:
+    import polars  # noqa: F401
+    HAS_POLARS = True
+except ImportError:
+    HAS_POLARS = False
+
+
+def _write_transactions(path: Path) -> pd.DataFrame:
+    """
+    Transaction CSV shaped like the converter output, with literal NA
+    tokens ('nan', 'NaN', 'NA', empty) in code, name and region columns
+    """
+    rng = np.random.default_rng(0)
+    n = 600
+    df = pd.DataFrame({
+        'geographical_level': rng.choice(['national', 'regional'], n),
+        'table': rng.choice(['투입계수', '지역계수'], n),
+        'output_region': rng.choice(['서울', '경남', 'nan'], n),
+        'output_sector_code': rng.integers(1, 30, n).astype(object),
+        'output_sector_name': None,
+        'input_region': 'nan',
+        'input_sector_code': rng.integers(1, 20, n).astype(object),
+        'input_sector_name': None,
+        'value': rng.integers(0, 50, n) / 4,
+    })
+    df['output_sector_name'] = 'n' + df['output_sector_code'].astype(str)
+    df['input_sector_name'] = 'm' + df['input_sector_code'].astype(str)
+    # A non-numeric code past polars' default 100-row inference sample
+    df.loc[250, 'output_sector_code'] = 'A01'
+    for col, token in [('output_sector_code', 'nan'), ('output_sector_name', 'NaN'),
+                       ('input_sector_code', 'NA'), ('input_sector_name', '')]:
+        df.loc[rng.choice(n, 25, replace=False), col] = token
+    df.to_csv(path, index=False, encoding='utf-8-sig')
+    return df
+
+
+def _in_order(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Key columns as text so tables can be compared cell by cell; rows keep
+    their order, which both engines must agree on
+    """
+    keys = [col for col in df.columns if col != 'value']
+    return df.assign(**{col: df[col].astype(str) for col in keys}).reset_index(drop=True)
+
+
+@unittest.skipUnless(HAS_POLARS, "polars is not installed")
+class PolarsEngineTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.csv_path = self.dir / 'transactions.csv'
+        self.df = _write_transactions(self.csv_path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _run(self, engine, filters, aggregation):
+        config = {
+            'data_source': {
+                'transaction_data_path': str(self.csv_path),
+                'index_data_path': str(self.csv_path),
+            },
+            'filters': filters,
+            'analysis': {'direction': 'both', 'aggregation': aggregation, 'engine': engine},
+            'output': {'save_results': False, 'verbose': False},
+        }
+        config_path = self.dir / f'config_{engine}.json'
+        config_path.write_text(json.dumps(config), encoding='utf-8')
+        return run_analysis(str(config_path))
+
+    def test_matches_pandas_engine(self):
+        cases = [
+            {},
+            {'geographical_level': 'national'},
+            {'output_region': '경남'},
+            {'output_sectors': ['1', 2, 'A01']},
+            {'input_sectors': ['1.0', '10']},
+            {'min_value': 5},
+            # Thresholds float32 can't represent, next to stored values
+            {'min_value': 1.2500000001},
+            {'max_value': 4.9999999999},
+        ]
+        for filters in cases:
+            for aggregation in ('sum', 'mean', 'max'):
+                with self.subTest(filters=filters, aggregation=aggregation):
+                    expected = self._run('pandas', filters, aggregation)
+                    actual = self._run('polars', filters, aggregation)
+                    for key in ('forward', 'backward'):
+                        exp, act = expected[key], actual[key]
+                        self.assertEqual(len(act), len(exp))
+                        if len(exp) == 0:
+                            continue
+                        self.assertEqual(list(act.columns), list(exp.columns))
+                        exp, act = _in_order(exp), _in_order(act)
+                        keys = [col for col in exp.columns if col != 'value']
+                        pd.testing.assert_frame_equal(act[keys], exp[keys], check_dtype=False)
+                        np.testing.assert_allclose(act['value'], exp['value'], rtol=1e-9)
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_binary_copy_gives_same_results(self):
+        cases = [{}, {'output_sectors': ['1', 2, 'A01']}, {'input_sectors': ['1.0', '10']}]
+        expected = [self._run('pandas', filters, 'sum') for filters in cases]
+        self.assertIsNotNone(write_binary_copy(self.df, self.csv_path, suffix='.arrow'))
+        for filters, exp in zip(cases, expected):
+            for engine in ('pandas', 'polars'):
+                with self.subTest(filters=filters, engine=engine):
+                    act = self._run(engine, filters, 'sum')
+                    for key in ('forward', 'backward'):
+                        pd.testing.assert_frame_equal(_in_order(act[key]), _in_order(exp[key]),
+                                                      check_dtype=False, check_categorical=False)
+
+
+class ValueFilterTest(unittest.TestCase):
+
+    def test_thresholds_compare_in_float64(self):
+        # load_data stores values as float32 when that is lossless
+        df = pd.DataFrame({'value': np.array([1.25, 5.0], dtype=np.float32)})
+        kept = apply_filters(df, {'filters': {'min_value': 1.2500000001}})
+        self.assertEqual(kept['value'].tolist(), [5.0])
+        kept = apply_filters(df, {'filters': {'max_value': 4.9999999999}})
+        self.assertEqual(kept['value'].tolist(), [1.25])
+
+
+class ResultOrderTest(unittest.TestCase):
+
+    def test_order_does_not_depend_on_input_rows(self):
+        # The same sector in several regions with equal values: only the
+        # region columns can order these rows
+        df = pd.DataFrame({
+            'output_region': ['서울', '경남', '부산', '서울', '경남', '부산'],
+            'output_sector_code': [1, 1, 1, 2, 2, 2],
+            'output_sector_name': ['a', 'a', 'a', 'b', 'b', 'b'],
+            'input_region': ['부산', '서울', '경남', '경남', '부산', '서울'],
+            'input_sector_code': [3, 3, 3, 4, 4, 4],
+            'input_sector_name': ['c', 'c', 'c', 'd', 'd', 'd'],
+            'value': 1.5,
+        })
+        for analyze in (analyze_forward, analyze_backward):
+            with self.subTest(analyze=analyze.__name__):
+                expected = analyze(df).reset_index(drop=True)
+                for seed in range(3):
+                    shuffled = df.sample(frac=1, random_state=seed)
+                    pd.testing.assert_frame_equal(analyze(shuffled).reset_index(drop=True), expected)
+                # Ties are ordered by the leading region, as a sorted groupby did
+                self.assertEqual(expected.iloc[:3, 0].tolist(), ['경남', '부산', '서울'])
+
+
+if __name__ == '__main__':
+    unittest.main()
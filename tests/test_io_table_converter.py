@@ -0,0 +1,166 @@
+"""
+Wide-to-long conversion of raw IO sheets and the long-table helpers
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from libs.io_table_converter import (
+    clean_io_table,
+    create_index_dataframe,
+    extract_input_headers,
+    io_table_to_long,
+    sample_per_table,
+)
+
+# Trailing columns clean_io_table always treats as totals
+N_TRAILING = 10
+
+
+def _raw_sheet(header_rows, body_rows):
+    """
+    Raw sheet as read with header=None: 4 title rows, the header rows,
+    then the body; every row gets N_TRAILING total columns (value 99)
+    """
+    n_cols = len(body_rows[0]) + N_TRAILING
+    rows = [['투입산출표'] + [np.nan] * (n_cols - 1)]
+    rows += [[np.nan] * n_cols for _ in range(3)]
+    for row in header_rows:
+        rows.append(row + [f'합계{i}' for i in range(N_TRAILING)])
+    for row in body_rows:
+        rows.append(row + [99.0] * N_TRAILING)
+    return pd.DataFrame(rows, dtype=object)
+
+
+def _national_sheet():
+    """
+    National sheet: input codes in row 4, names in row 5 (data from
+    column 2); column 4 is an intermediate-input total
+    """
+    nan = np.nan
+    return _raw_sheet(
+        header_rows=[
+            [nan, nan, '01', '02', '900', '03'],
+            [nan, nan, '농산물', '광산품', '중간투입계', '식료품'],
+        ],
+        body_rows=[
+            ['01', '농산물', 1.0, 0.0, 9.0, 2.5],
+            ['02', '광산품', nan, 3.0, 9.0, 4.0],
+            ['중간투입계', '중간투입계', 5.0, 5.0, 5.0, 5.0],
+            [nan, nan, 7.0, 7.0, 7.0, 7.0],
+            ['03', '식료품', 0.5, 'x', 9.0, 0.0],
+        ],
+    )
+
+
+def _regional_sheet():
+    """
+    Regional sheet: input region/code/name in rows 4-6 (data from
+    column 3); column 5 is an intermediate-input total
+    """
+    nan = np.nan
+    return _raw_sheet(
+        header_rows=[
+            [nan, nan, nan, '서울', '서울', '서울', '부산'],
+            [nan, nan, nan, '01', '02', '중간투입계', '01'],
+            [nan, nan, nan, '농산물', '광산품', '중간투입계', '농산물'],
+        ],
+        body_rows=[
+            ['서울', '01', '농산물', 1.0, 0.0, 9.0, 2.0],
+            ['서울', '소계', '소계', 5.0, 5.0, 5.0, 5.0],
+            ['부산', '01', '농산물', 0.0, 3.0, 9.0, nan],
+            [nan, '02', '광산품', 4.0, 4.0, 4.0, 4.0],
+        ],
+    )
+
+
+class IoTableToLongTest(unittest.TestCase):
+
+    def _to_long(self, df_raw, is_regional):
+        df_clean = clean_io_table(df_raw, is_regional=is_regional)
+        return io_table_to_long(df_clean, df_raw=df_raw, sheet_name='투입계수',
+                                is_regional=is_regional)
+
+    def test_national_sheet(self):
+        df_long = self._to_long(_national_sheet(), is_regional=False)
+
+        # Row-major over the sheet; summary rows/columns, rows without a
+        # code, trailing totals and 0 / NaN / text cells are all dropped
+        expected = pd.DataFrame({
+            'output_sector_code': ['01', '01', '02', '02', '03'],
+            'output_sector_name': ['농산물', '농산물', '광산품', '광산품', '식료품'],
+            'value': [1.0, 2.5, 3.0, 4.0, 0.5],
+            'input_sector_code': ['01', '03', '02', '03', '01'],
+            'input_sector_name': ['농산물', '식료품', '광산품', '식료품', '농산물'],
+            'table': '투입계수',
+        })
+        pd.testing.assert_frame_equal(df_long, expected, check_dtype=False)
+
+    def test_regional_sheet(self):
+        df_long = self._to_long(_regional_sheet(), is_regional=True)
+
+        expected = pd.DataFrame({
+            'output_region': ['서울', '서울', '부산'],
+            'output_sector_code': ['01', '01', '01'],
+            'output_sector_name': ['농산물', '농산물', '농산물'],
+            'value': [1.0, 2.0, 3.0],
+            'input_region': ['서울', '부산', '서울'],
+            'input_sector_code': ['01', '01', '02'],
+            'input_sector_name': ['농산물', '농산물', '광산품'],
+            'table': '투입계수',
+        })
+        pd.testing.assert_frame_equal(df_long, expected, check_dtype=False)
+
+    def test_national_headers_skip_incomplete_columns(self):
+        df_raw = _national_sheet()
+        df_raw.iloc[5, 3] = np.nan
+        headers = extract_input_headers(df_raw, is_regional=False)
+        self.assertEqual(list(headers['input_sector_code'][:3]), ['01', '900', '03'])
+        self.assertEqual(list(headers['input_sector_name'][:3]), ['농산물', '중간투입계', '식료품'])
+
+    def test_clean_io_table_drops_summary_rows_and_columns(self):
+        df_clean = clean_io_table(_national_sheet(), is_regional=False)
+        self.assertEqual(list(df_clean.columns), [0, 1, 2, 3, 5])
+        self.assertEqual(list(df_clean[0]), ['01', '02', '03'])
+        # Row labels count the rows left after removing summary rows
+        self.assertEqual(list(df_clean.index), [1, 2, 4])
+
+
+class LongTableHelpersTest(unittest.TestCase):
+
+    def test_sample_per_table(self):
+        df_long = pd.DataFrame({
+            'table': ['a', 'b', 'a', 'a', None, 'b', 'c', 'a'],
+            'value': np.arange(8.0),
+        })
+        sampled = sample_per_table(df_long, 'table', n_rows=2)
+
+        # First n_rows rows of each table, tables in order of appearance
+        self.assertEqual(list(sampled['table']), ['a', 'a', 'b', 'b', 'c'])
+        self.assertEqual(list(sampled['value']), [0.0, 2.0, 1.0, 5.0, 6.0])
+        self.assertEqual(list(sampled.index), list(range(5)))
+
+        counts = sample_per_table(df_long, 'table', n_rows=3)['table'].value_counts()
+        self.assertEqual(counts.to_dict(), {'a': 3, 'b': 2, 'c': 1})
+
+    def test_index_dataframe_joins_unique_values(self):
+        df_long = pd.DataFrame({
+            'geographical_level': ['regional', 'national', 'regional', 'regional'],
+            'output_region': ['서울', None, '부산', '경남'],
+            'output_sector_code': ['01', '01', '02', '01'],
+            'output_sector_name': ['농산물', '농산물', '광산품', '농산물'],
+            'input_sector_code': ['02', '03', '01', '02'],
+        })
+        df_index = create_index_dataframe(df_long)
+
+        self.assertEqual(list(df_index['sector_code']), ['01', '02', '03'])
+        self.assertEqual(list(df_index['geographical_level']),
+                         ['national, regional', 'regional', 'national'])
+        self.assertEqual(list(df_index['region'][:2]), ['경남, 서울', '부산'])
+        self.assertTrue(pd.isna(df_index['region'][2]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+read_table caching, and binary copies that must read back exactly like
+the CSV they were saved as
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from libs import table_io
+from libs.table_io import HAS_PYARROW, read_table, resolve_table_path, write_binary_copy
+
+
+def _frame() -> pd.DataFrame:
+    """
+    Columns shaped like the converter and analyzer outputs: sector codes
+    mixing int and str (as parsed by openpyxl), NA tokens, categoricals,
+    float32 values and nullable integers
+    """
+    rng = np.random.default_rng(0)
+    n = 400
+    codes = np.array([1, 22, '001', 'A01', None, 'nan', np.nan, 3.5], dtype=object)
+    return pd.DataFrame({
+        'sector_code': pd.Series(rng.choice(codes, n), dtype=object),
+        'int_code': pd.Series(rng.choice(np.array([1, 22, 333], dtype=object), n), dtype=object),
+        'region': pd.Series(rng.choice(['서울', '부산', 'NA'], n)).astype('category'),
+        'sector_name': rng.choice(['농산물', '광산품', ''], n),
+        'level': rng.integers(0, 9, n).astype(np.int32),
+        'count': pd.array(np.where(rng.random(n) < 0.1, None, rng.integers(0, 9, n)), dtype='Int64'),
+        'value': np.r_[rng.integers(0, 10**7, n - 3) / 8, 1234567.125, np.nan, 2.0**30].astype(np.float32),
+        'ratio': rng.normal(size=n),
+        'empty': pd.Series([None] * n, dtype=object),
+    })
+
+
+@unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+class BinaryCopyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.csv_path = Path(self.tmp.name) / 'table.csv'
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_copy_reads_like_csv(self):
+        df = _frame()
+        df.to_csv(self.csv_path, index=False, encoding='utf-8-sig')
+        expected = read_table(self.csv_path, cache=False)
+        for suffix in ('.parquet', '.arrow'):
+            with self.subTest(suffix=suffix):
+                binary_path = write_binary_copy(df, self.csv_path, suffix=suffix)
+                self.assertEqual(binary_path, self.csv_path.with_suffix(suffix))
+                pd.testing.assert_frame_equal(read_table(binary_path, cache=False), expected)
+
+    def test_resolve_skips_stale_copy(self):
+        df = _frame()
+        df.to_csv(self.csv_path, index=False)
+        binary_path = write_binary_copy(df, self.csv_path, suffix='.arrow')
+        self.assertEqual(resolve_table_path(self.csv_path), binary_path)
+
+        # CSV rewritten after the copy: the copy is stale
+        stat = binary_path.stat()
+        os.utime(self.csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        self.assertEqual(resolve_table_path(self.csv_path), self.csv_path)
+
+        # Non-CSV paths are used as given
+        self.assertEqual(resolve_table_path(binary_path), binary_path)
+
+
+class ReadTableCacheTest(unittest.TestCase):
+
+    def test_rewritten_file_replaces_cached_version(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'table.csv'
+            pd.DataFrame({'value': [1.0, 2.0]}).to_csv(path, index=False)
+            self.assertEqual(read_table(path)['value'].tolist(), [1.0, 2.0])
+
+            pd.DataFrame({'value': [3.0, 4.0, 5.0]}).to_csv(path, index=False)
+            self.assertEqual(read_table(path)['value'].tolist(), [3.0, 4.0, 5.0])
+
+            entries = [key for key in table_io._TABLE_CACHE if key[0] == path.resolve()]
+            self.assertEqual(len(entries), 1)
+            table_io._TABLE_CACHE.pop(entries[0])
+
+
+if __name__ == '__main__':
+    unittest.main()